@@ -5,67 +5,440 @@ Website analyzer module using Lighthouse integration
 import os
 import json
 import time
+import queue
+import socket
+import shutil
+import asyncio
+import hashlib
+import functools
+import itertools
 import tempfile
+import weakref
+import threading
 import subprocess
+import aiohttp
 import requests
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson decodes large reports several times faster than the stdlib
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+from src.core.cache import ResultCache
+from src.utils.helpers import clean_url
+
+# How long analysis results are reused before a site is re-analyzed
+RESULT_CACHE_TTL = 86400  # 24 hours
+
+# How long page validators (ETag/Last-Modified) are kept for conditional requests
+VALIDATOR_CACHE_TTL = 30 * 86400  # 30 days
+
+# Page bodies are streamed in chunks and abandoned once the basics are known
+BODY_CHUNK_SIZE = 16384
+BODY_SCAN_LIMIT = 512000  # bytes
+LARGE_PAGE_KB = 5000
+
+# Google PageSpeed Insights runs Lighthouse remotely and returns the same report
+PSI_ENDPOINT = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+PSI_CATEGORIES = ("PERFORMANCE", "SEO", "ACCESSIBILITY", "BEST_PRACTICES")
+PSI_TIMEOUT = 60  # seconds
+PSI_CONCURRENCY = 16  # in-flight PageSpeed Insights calls per batch
+
+# Lighthouse audits reported as issues when they score below 0.5, in report order;
+# "{value}" is replaced with the audit's displayValue
+_AUDIT_MESSAGES = (
+    # Performance issues
+    ("largest-contentful-paint", "Slow content loading (LCP: {value})"),
+    ("total-blocking-time", "Poor interactivity (TBT: {value})"),
+    ("cumulative-layout-shift", "Layout shifts during loading (CLS: {value})"),
+    # SEO issues
+    ("meta-description", "Missing meta description"),
+    ("document-title", "Missing or poor document title"),
+    ("link-text", "Poor or generic link text"),
+    ("hreflang", "Incorrect hreflang links"),
+    ("canonical", "Missing canonical link"),
+    ("robots-txt", "Problems with robots.txt"),
+    ("structured-data", "Missing structured data"),
+    # Accessibility issues
+    ("color-contrast", "Poor color contrast for text"),
+    ("image-alt", "Images missing alt text"),
+    # Best Practices issues
+    ("is-on-https", "Not using HTTPS"),
+    ("doctype", "Missing doctype"),
+)
+
+# Audits kept when trimming a Lighthouse report; the rest are dropped
+_WANTED_AUDITS = frozenset(key for key, _ in _AUDIT_MESSAGES)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome():
+    """
+    Find a local Chrome installation
+
+    The search runs once per process and is shared by every caller.
+
+    Returns:
+        Path to the Chrome executable, or None if not found
+    """
+    chrome_paths = [
+        # Windows
+        os.path.join(
+            os.environ.get("PROGRAMFILES", "C:\\Program Files"),
+            "Google\\Chrome\\Application\\chrome.exe",
+        ),
+        os.path.join(
+            os.environ.get("PROGRAMFILES(X86)", "C:\\Program Files (x86)"),
+            "Google\\Chrome\\Application\\chrome.exe",
+        ),
+        # macOS
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        # Linux
+        "/usr/bin/google-chrome",
+        "/usr/bin/chrome",
+        "/usr/bin/chromium",
+        "/usr/bin/chromium-browser",
+    ]
+
+    for path in chrome_paths:
+        if os.path.exists(path):
+            return path
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_lighthouse():
+    """
+    Check if Lighthouse is available via Chrome
+
+    The probe runs once per process and is shared by every analyzer.
+
+    Returns:
+        Tuple of (lighthouse available, path to Chrome or None)
+    """
+    try:
+        # First, try to check for Chrome with DevTools protocol capability
+        chrome_path = _find_chrome()
+        if chrome_path:
+            print("Chrome browser found, can use DevTools Protocol for Lighthouse")
+            return True, chrome_path
+
+        # Fall back to checking for standalone Lighthouse
+        result = subprocess.run(
+            ["lighthouse", "--version"], capture_output=True, text=True, timeout=10
+        )
+        return result.returncode == 0, None
+    except:
+        return False, None
+
+
+class _BodyScanner:
+    """Incremental viewport and page-size check over a streamed page body"""
+
+    def __init__(self, headers):
+        """
+        Initialize the scanner
+
+        Args:
+            headers: Response headers of the page being streamed
+        """
+        # Content-Length only gives the real page size for an unencoded body;
+        # iter_content/iter_chunked yield decompressed bytes
+        self.known_size = 0
+        if headers.get("Content-Encoding", "identity").lower() == "identity":
+            try:
+                self.known_size = int(headers.get("Content-Length", 0))
+            except (TypeError, ValueError):
+                pass
+
+        self.has_viewport = False
+        self.bytes_read = 0
+        self._tail = b""
+
+    @property
+    def size(self):
+        """Page size in bytes, counted from the body when no usable header"""
+        return self.known_size or self.bytes_read
+
+    def feed(self, chunk):
+        """
+        Consume the next chunk of the body
+
+        Returns:
+            True once nothing more needs to be read
+        """
+        self.bytes_read += len(chunk)
+
+        if not self.has_viewport:
+            # Overlap with the previous chunk so a split "viewport" is still found
+            window = self._tail + chunk
+            self.has_viewport = b"viewport" in window.lower()
+            self._tail = window[-7:]
+
+        if self.known_size:
+            return self.has_viewport or self.bytes_read > BODY_SCAN_LIMIT
+
+        # Size unknown: keep counting (without buffering) until the page is
+        # known to be large
+        return self.bytes_read > LARGE_PAGE_KB * 1024
+
+
+class ChromePool:
+    """Pool of long-lived headless Chrome instances for Lighthouse runs"""
+
+    def __init__(self, chrome_path=None, size=4, base_port=9222, max_uses=100):
+        """
+        Launch the pool
+
+        Args:
+            chrome_path: Path to the Chrome executable (found automatically if None)
+            size: Number of Chrome instances to keep running
+            base_port: First remote debugging port to try; ports already in use
+                (e.g. by another analyzer's pool) are skipped
+            max_uses: Runs after which an instance is restarted
+        """
+        self.chrome_path = chrome_path or _find_chrome()
+        self.max_uses = max_uses
+        self._ports = queue.Queue()
+        self._workers = {}
+
+        # Stop the instances at interpreter exit even if close() is never called
+        self._finalizer = weakref.finalize(self, ChromePool._shutdown, self._workers)
+
+        try:
+            port = base_port
+            while len(self._workers) < size:
+                if port >= base_port + size + 100:
+                    raise RuntimeError(f"No free debugging ports from {base_port}")
+                if not self._port_in_use(port):
+                    user_data_dir = tempfile.mkdtemp(
+                        prefix=f"uklead-chrome-{len(self._workers)}-"
+                    )
+                    self._workers[port] = self._launch(port, user_data_dir)
+                port += 1
+
+            for port, worker in self._workers.items():
+                self._wait_until_ready(port, worker)
+        except Exception:
+            self.close()
+            raise
+
+        for port in self._workers:
+            self._ports.put(port)
+
+    def _launch(self, port, user_data_dir):
+        """Start a headless Chrome listening on the given debugging port"""
+        process = subprocess.Popen(
+            [
+                self.chrome_path,
+                "--headless",
+                "--disable-gpu",
+                f"--remote-debugging-port={port}",
+                "--enable-automation",
+                "--no-sandbox",
+                f"--user-data-dir={user_data_dir}",
+                "about:blank",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return {"process": process, "user_data_dir": user_data_dir, "uses": 0}
+
+    @staticmethod
+    def _port_in_use(port):
+        """Check whether something is already listening on a local port"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            return sock.connect_ex(("127.0.0.1", port)) == 0
+
+    def _wait_until_ready(self, port, worker, timeout=10):
+        """
+        Poll Chrome's DevTools endpoint until it answers
+
+        Args:
+            port: Remote debugging port to probe
+            worker: Worker record of the Chrome instance listening on port
+            timeout: Seconds to wait before giving up
+
+        Raises:
+            RuntimeError: If Chrome exits or does not respond within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            returncode = worker["process"].poll()
+            if returncode is not None:
+                raise RuntimeError(f"Chrome on port {port} exited ({returncode})")
+
+            try:
+                requests.get(f"http://127.0.0.1:{port}/json/version", timeout=0.2)
+                return
+            except requests.RequestException:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Chrome on port {port} not ready")
+                time.sleep(0.05)
+
+    @staticmethod
+    def _stop(worker):
+        """Terminate a Chrome instance"""
+        try:
+            worker["process"].terminate()
+            worker["process"].wait(timeout=5)
+        except:
+            try:
+                worker["process"].kill()
+            except:
+                pass
+
+    def acquire(self, timeout=None):
+        """
+        Check out a Chrome instance
+
+        Args:
+            timeout: Seconds to wait for a free instance (None waits forever)
+
+        Returns:
+            Remote debugging port of the checked-out instance
+        """
+        return self._ports.get(timeout=timeout)
+
+    def release(self, port):
+        """
+        Return a Chrome instance to the pool, restarting it if worn out or dead
+
+        Args:
+            port: Port previously returned by acquire
+        """
+        worker = self._workers[port]
+        worker["uses"] += 1
+
+        if worker["uses"] >= self.max_uses or worker["process"].poll() is not None:
+            self._stop(worker)
+
+            if self._port_in_use(port):
+                # Someone else took the port; drop it rather than share it
+                print(f"Debugging port {port} taken, removing it from the pool")
+                shutil.rmtree(worker["user_data_dir"], ignore_errors=True)
+                del self._workers[port]
+                return
+
+            self._workers[port] = self._launch(port, worker["user_data_dir"])
+            try:
+                self._wait_until_ready(port, self._workers[port])
+            except RuntimeError as e:
+                print(f"Error restarting Chrome: {e}")
+                # Retry the restart the next time this instance is released
+                self._workers[port]["uses"] = self.max_uses
+
+        self._ports.put(port)
+
+    @staticmethod
+    def _shutdown(workers):
+        """Stop the given Chrome instances and remove their profiles"""
+        for worker in workers.values():
+            ChromePool._stop(worker)
+            shutil.rmtree(worker["user_data_dir"], ignore_errors=True)
+
+    def close(self):
+        """Stop all Chrome instances and remove their profiles"""
+        self._finalizer()
 
 
 class WebsiteAnalyzer:
     """Website analysis with Lighthouse integration"""
 
-    def __init__(self, use_lighthouse=True):
+    def __init__(
+        self,
+        use_lighthouse=True,
+        use_cache=True,
+        chrome_pool_size=4,
+        use_psi=True,
+        psi_api_key=None,
+    ):
         """
         Initialize the analyzer
 
         Args:
             use_lighthouse: Whether to attempt to use Lighthouse
+            use_cache: Whether to reuse recent results for previously analyzed URLs
+            chrome_pool_size: Number of headless Chrome instances kept for Lighthouse
+            use_psi: Whether to run Lighthouse through the PageSpeed Insights API
+                before falling back to a local Lighthouse
+            psi_api_key: PageSpeed Insights API key (defaults to $PAGESPEED_API_KEY)
         """
         self.use_lighthouse = use_lighthouse
-        self.lighthouse_available = (
-            self._check_lighthouse() if use_lighthouse else False
+        self.use_psi = use_lighthouse and use_psi
+        self.psi_api_key = psi_api_key or os.environ.get("PAGESPEED_API_KEY")
+        self.cache = ResultCache() if use_cache else None
+        self.lighthouse_available = False
+        self._chrome_path = None
+        if use_lighthouse:
+            self.lighthouse_available, self._chrome_path = _detect_lighthouse()
+
+        # Chrome instances are only launched once Lighthouse is first needed
+        self.chrome_pool_size = chrome_pool_size
+        self._chrome_pool = None
+        self._chrome_pool_lock = threading.Lock()
+        # At most one local Lighthouse run per Chrome instance at a time
+        self._chrome_slots = threading.BoundedSemaphore(chrome_pool_size)
+
+        # Scratch directory for Lighthouse reports, removed on close or exit
+        self._scratch = tempfile.TemporaryDirectory(prefix="uklead-")
+        self._scratch_counter = itertools.count()
+
+        # Shared session so repeat requests reuse pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # PageSpeed Insights gets its own session without retries: each retry
+        # would start another remote Lighthouse run and wait PSI_TIMEOUT again
+        self.psi_session = requests.Session()
+        self.psi_session.mount(
+            "https://", HTTPAdapter(pool_maxsize=PSI_CONCURRENCY, max_retries=0)
         )
 
-    def _check_lighthouse(self):
-        """Check if Lighthouse is available via Chrome"""
-        try:
-            # First, try to check for Chrome with DevTools protocol capability
-            chrome_paths = [
-                # Windows
-                os.path.join(
-                    os.environ.get("PROGRAMFILES", "C:\\Program Files"),
-                    "Google\\Chrome\\Application\\chrome.exe",
-                ),
-                os.path.join(
-                    os.environ.get("PROGRAMFILES(X86)", "C:\\Program Files (x86)"),
-                    "Google\\Chrome\\Application\\chrome.exe",
-                ),
-                # macOS
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                # Linux
-                "/usr/bin/google-chrome",
-                "/usr/bin/chrome",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-            ]
-
-            chrome_found = False
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    chrome_found = True
-                    break
+    def __enter__(self):
+        return self
 
-            if chrome_found:
-                print("Chrome browser found, can use DevTools Protocol for Lighthouse")
-                return True
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-            # Fall back to checking for standalone Lighthouse
-            result = subprocess.run(
-                ["lighthouse", "--version"], capture_output=True, text=True, timeout=10
-            )
-            return result.returncode == 0
-        except:
-            return False
+    def close(self):
+        """Clean up resources"""
+        self.session.close()
+        self.psi_session.close()
+        if self.cache:
+            self.cache.close()
+        if self._chrome_pool:
+            self._chrome_pool.close()
+            self._chrome_pool = None
+        self._scratch.cleanup()
 
     def analyze_website(self, url):
         """
@@ -78,15 +451,7 @@ class WebsiteAnalyzer:
             Dictionary with analysis results
         """
         # Initialize results with default values
-        results = {
-            "performance_score": 0,
-            "seo_score": 0,
-            "accessibility_score": 0,
-            "best_practices_score": 0,
-            "has_ssl": False,
-            "has_mobile_viewport": False,
-            "issues": [],
-        }
+        results = self._empty_results()
 
         # Basic validation
         if not url:
@@ -97,15 +462,24 @@ class WebsiteAnalyzer:
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
 
+        # Reuse a recent analysis of the same URL if we have one
+        cached = self._get_cached_results(url)
+        if cached:
+            return cached
+
         # First do some basic checks
         self._check_website_basics(url, results)
 
-        # If Lighthouse is available, run it
-        if self.lighthouse_available:
+        # Run Lighthouse, preferring PageSpeed Insights over a local install
+        lighthouse_results = None
+        if self.use_psi:
+            lighthouse_results = self._run_lighthouse_psi(url)
+        if not lighthouse_results and self.lighthouse_available:
             lighthouse_results = self._run_lighthouse(url)
-            if lighthouse_results:
-                self._process_lighthouse_results(lighthouse_results, results)
-        else:
+
+        if lighthouse_results:
+            self._process_lighthouse_results(lighthouse_results, results)
+        elif not self.lighthouse_available:
             results["issues"].append("Lighthouse not available for detailed analysis")
             # Perform basic web checks as fallback
             self._perform_basic_analysis(url, results)
@@ -113,24 +487,225 @@ class WebsiteAnalyzer:
         # Set the priority based on results
         results["priority"] = self._calculate_priority(results)
 
+        # A Lighthouse run that was attempted but produced nothing isn't final
+        lighthouse_failed = not lighthouse_results and (
+            self.use_psi or self.lighthouse_available
+        )
+        if not lighthouse_failed:
+            self._store_cached_results(url, results)
+
+        return results
+
+    def analyze_websites(self, urls, max_workers=16):
+        """
+        Analyze several websites concurrently from synchronous code
+
+        Each URL goes through analyze_website on a worker thread; the HTTP
+        requests and Lighthouse subprocesses release the GIL while waiting.
+        Async callers should use analyze_many instead.
+
+        Args:
+            urls: Iterable of website URLs
+            max_workers: Maximum number of websites analyzed at once
+
+        Returns:
+            List of analysis result dictionaries, in the same order as urls
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.analyze_website, urls))
+
+    async def analyze_many(self, urls, max_concurrency=50):
+        """
+        Analyze several websites concurrently over a shared aiohttp session
+
+        Args:
+            urls: Iterable of website URLs
+            max_concurrency: Maximum number of websites analyzed at once
+
+        Returns:
+            List of analysis result dictionaries, in the same order as urls
+        """
+        connector = aiohttp.TCPConnector(
+            limit=max_concurrency, limit_per_host=4, ttl_dns_cache=300
+        )
+        # Per-socket timeouts, so time spent queued for a pooled connection
+        # doesn't count against a site
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+        headers = {"User-Agent": self.session.headers["User-Agent"]}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # PageSpeed Insights is a single host with 10-30 s runs, so it gets its
+        # own pool; the semaphore keeps calls from queueing on a connection
+        # inside their timeout
+        psi_connector = aiohttp.TCPConnector(limit_per_host=PSI_CONCURRENCY)
+        psi_timeout = aiohttp.ClientTimeout(total=PSI_TIMEOUT)
+        psi_semaphore = asyncio.Semaphore(PSI_CONCURRENCY)
+
+        async def analyze(url):
+            async with semaphore:
+                return await self._analyze_one(
+                    session, url, psi_session, psi_semaphore
+                )
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=headers
+        ) as session:
+            async with aiohttp.ClientSession(
+                connector=psi_connector, timeout=psi_timeout
+            ) as psi_session:
+                return await asyncio.gather(*[analyze(url) for url in urls])
+
+    async def _analyze_one(self, session, url, psi_session, psi_semaphore):
+        """Async counterpart of analyze_website used by analyze_many"""
+        results = self._empty_results()
+
+        # Basic validation
+        if not url:
+            results["issues"].append("No URL provided")
+            return results
+
+        # Ensure URL has scheme
+        if not url.startswith(("http://", "https://")):
+            url = "https://" + url
+
+        # Reuse a recent analysis of the same URL if we have one
+        cached = self._get_cached_results(url)
+        if cached:
+            return cached
+
+        # First do some basic checks
+        await self._check_website_basics_async(session, url, results)
+
+        # Run Lighthouse, preferring PageSpeed Insights over a local install
+        lighthouse_results = None
+        if self.use_psi:
+            lighthouse_results = await self._run_lighthouse_psi_async(
+                psi_session, psi_semaphore, url
+            )
+        if not lighthouse_results and self.lighthouse_available:
+            # Local Lighthouse blocks, so run it off the event loop
+            loop = asyncio.get_running_loop()
+            lighthouse_results = await loop.run_in_executor(
+                None, self._run_lighthouse, url
+            )
+
+        if lighthouse_results:
+            self._process_lighthouse_results(lighthouse_results, results)
+        elif not self.lighthouse_available:
+            results["issues"].append("Lighthouse not available for detailed analysis")
+            # Perform basic web checks as fallback
+            await self._perform_basic_analysis_async(session, url, results)
+
+        # Set the priority based on results
+        results["priority"] = self._calculate_priority(results)
+
+        # A Lighthouse run that was attempted but produced nothing isn't final
+        lighthouse_failed = not lighthouse_results and (
+            self.use_psi or self.lighthouse_available
+        )
+        if not lighthouse_failed:
+            self._store_cached_results(url, results)
+
         return results
 
+    def _cache_key(self, url, prefix="lh"):
+        """Build the cache key for a URL"""
+        return f"{prefix}:{hashlib.sha1(clean_url(url).encode()).hexdigest()}"
+
+    def _get_cached_results(self, url):
+        """Return cached results for a URL, or None on a miss"""
+        if not self.cache:
+            return None
+
+        cached = self.cache.get(self._cache_key(url))
+        if not cached:
+            return None
+
+        try:
+            return _json_loads(cached)
+        except ValueError:
+            return None
+
+    def _store_cached_results(self, url, results):
+        """Cache complete results for a URL unless the site could not be reached"""
+        if not self.cache:
+            return
+
+        # Don't let a transient outage stick for the whole TTL
+        if any(
+            issue.startswith("Error accessing website") for issue in results["issues"]
+        ):
+            return
+
+        self.cache.set(self._cache_key(url), _json_dumps(results), RESULT_CACHE_TTL)
+
+    def _get_cached_validators(self, url):
+        """Return the stored ETag/Last-Modified snapshot for a URL, or None"""
+        if not self.cache:
+            return None
+
+        cached = self.cache.get(self._cache_key(url, prefix="etag"))
+        if not cached:
+            return None
+
+        try:
+            return _json_loads(cached)
+        except ValueError:
+            return None
+
+    def _conditional_headers(self, validators):
+        """Build If-None-Match/If-Modified-Since headers from a snapshot"""
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _store_validators(self, url, headers, has_viewport, body_size):
+        """Remember a page's validators and basic-check results for next time"""
+        if not self.cache:
+            return
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        snapshot = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "has_mobile_viewport": has_viewport,
+            "body_size": body_size,
+        }
+        self.cache.set(
+            self._cache_key(url, prefix="etag"),
+            _json_dumps(snapshot),
+            VALIDATOR_CACHE_TTL,
+        )
+
+    def _empty_results(self):
+        """Return a results dictionary populated with default values"""
+        return {
+            "performance_score": 0,
+            "seo_score": 0,
+            "accessibility_score": 0,
+            "best_practices_score": 0,
+            "has_ssl": False,
+            "has_mobile_viewport": False,
+            "issues": [],
+        }
+
     def _check_website_basics(self, url, results):
         """Check basic website properties"""
         try:
             # Check for SSL (https)
-            results["has_ssl"] = url.startswith("https://")
-            if not results["has_ssl"]:
-                results["issues"].append("Website does not use SSL (https)")
-
+            https_url = self._check_ssl(url, results)
+            if https_url:
                 # Try checking if HTTPS is available
-                https_url = (
-                    "https://" + url[7:]
-                    if url.startswith("http://")
-                    else "https://" + url
-                )
                 try:
-                    response = requests.head(
+                    response = self.session.head(
                         https_url, timeout=10, allow_redirects=True
                     )
                     if response.status_code < 400:
@@ -140,116 +715,235 @@ class WebsiteAnalyzer:
                 except:
                     pass
 
-            # Try to get the webpage
-            response = requests.get(url, timeout=10)
+            # Try to get the webpage, revalidating against the last visit if we can
+            validators = self._get_cached_validators(url)
+            with self.session.get(
+                url,
+                timeout=10,
+                stream=True,
+                headers=self._conditional_headers(validators),
+            ) as response:
+                has_viewport = False
+                body_size = 0
+                if response.status_code == 304 and validators:
+                    # Unchanged since last time, so reuse the stored results
+                    has_viewport = validators["has_mobile_viewport"]
+                    body_size = validators["body_size"]
+                elif response.status_code < 400:
+                    # Read only as much of the body as the checks need
+                    scanner = _BodyScanner(response.headers)
+                    for chunk in response.iter_content(BODY_CHUNK_SIZE):
+                        if scanner.feed(chunk):
+                            break
+                    has_viewport = scanner.has_viewport
+                    body_size = scanner.size
+                    self._store_validators(
+                        url, response.headers, has_viewport, body_size
+                    )
 
-            # Check for success
-            if response.status_code >= 400:
-                results["issues"].append(
-                    f"Website returns HTTP status {response.status_code}"
-                )
-                return
+            self._evaluate_basics(
+                url,
+                results,
+                response.status_code,
+                response.url,
+                has_viewport,
+                body_size,
+            )
 
-            # Check for redirect to another domain
-            if urlparse(response.url).netloc != urlparse(url).netloc:
-                results["issues"].append(f"Website redirects to {response.url}")
+        except requests.RequestException as e:
+            results["issues"].append(f"Error accessing website: {str(e)}")
+        except Exception as e:
+            results["issues"].append(f"Error during basic analysis: {str(e)}")
 
-            # Check for mobile viewport meta tag
-            if "viewport" in response.text.lower():
-                results["has_mobile_viewport"] = True
-            else:
-                results["issues"].append("No mobile viewport meta tag found")
+    async def _check_website_basics_async(self, session, url, results):
+        """Check basic website properties using an aiohttp session"""
+        try:
+            # Check for SSL (https)
+            https_url = self._check_ssl(url, results)
+            if https_url:
+                # Try checking if HTTPS is available
+                try:
+                    async with session.head(
+                        https_url, allow_redirects=True
+                    ) as response:
+                        if response.status < 400:
+                            results["issues"].append(
+                                "HTTPS is available but not used by default"
+                            )
+                except Exception:
+                    pass
 
-            # Check page size
-            page_size_kb = len(response.content) / 1024
-            if page_size_kb > 5000:
-                results["issues"].append(f"Page size is large ({page_size_kb:.1f} KB)")
+            # Try to get the webpage, revalidating against the last visit if we can
+            validators = self._get_cached_validators(url)
+            async with session.get(
+                url, headers=self._conditional_headers(validators)
+            ) as response:
+                has_viewport = False
+                body_size = 0
+                if response.status == 304 and validators:
+                    # Unchanged since last time, so reuse the stored results
+                    has_viewport = validators["has_mobile_viewport"]
+                    body_size = validators["body_size"]
+                elif response.status < 400:
+                    # Read only as much of the body as the checks need
+                    scanner = _BodyScanner(response.headers)
+                    async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                        if scanner.feed(chunk):
+                            break
+                    has_viewport = scanner.has_viewport
+                    body_size = scanner.size
+                    self._store_validators(
+                        url, response.headers, has_viewport, body_size
+                    )
 
-        except requests.RequestException as e:
+            self._evaluate_basics(
+                url,
+                results,
+                response.status,
+                str(response.url),
+                has_viewport,
+                body_size,
+            )
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             results["issues"].append(f"Error accessing website: {str(e)}")
         except Exception as e:
             results["issues"].append(f"Error during basic analysis: {str(e)}")
 
-    def _run_lighthouse(self, url):
-        """Run Lighthouse analysis on a website"""
-        # Create a temporary file for the output
-        fd, output_path = tempfile.mkstemp(suffix=".json")
-        os.close(fd)
+    def _check_ssl(self, url, results):
+        """
+        Record whether the URL uses SSL
 
-        try:
-            # Determine if we can use Chrome's DevTools Protocol for Lighthouse
-            chrome_found = False
-            chrome_paths = [
-                # Windows
-                os.path.join(
-                    os.environ.get("PROGRAMFILES", "C:\\Program Files"),
-                    "Google\\Chrome\\Application\\chrome.exe",
-                ),
-                os.path.join(
-                    os.environ.get("PROGRAMFILES(X86)", "C:\\Program Files (x86)"),
-                    "Google\\Chrome\\Application\\chrome.exe",
-                ),
-                # macOS
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                # Linux
-                "/usr/bin/google-chrome",
-                "/usr/bin/chrome",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-            ]
+        Returns:
+            The https:// variant of the URL to probe when SSL is not used, else None
+        """
+        results["has_ssl"] = url.startswith("https://")
+        if results["has_ssl"]:
+            return None
 
-            chrome_path = None
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    chrome_path = path
-                    chrome_found = True
-                    break
+        results["issues"].append("Website does not use SSL (https)")
+        return "https://" + url[7:] if url.startswith("http://") else "https://" + url
+
+    def _evaluate_basics(
+        self, url, results, status_code, final_url, has_viewport, size
+    ):
+        """Record basic-check issues for a fetched page"""
+        # Check for success
+        if status_code >= 400:
+            results["issues"].append(f"Website returns HTTP status {status_code}")
+            return
+
+        # Check for redirect to another domain
+        if urlparse(final_url).netloc != urlparse(url).netloc:
+            results["issues"].append(f"Website redirects to {final_url}")
+
+        # Check for mobile viewport meta tag
+        if has_viewport:
+            results["has_mobile_viewport"] = True
+        else:
+            results["issues"].append("No mobile viewport meta tag found")
+
+        # Check page size
+        page_size_kb = size / 1024
+        if page_size_kb > LARGE_PAGE_KB:
+            results["issues"].append(f"Page size is large ({page_size_kb:.1f} KB)")
+
+    def _psi_params(self, url):
+        """Build the PageSpeed Insights query parameters for a URL"""
+        params = [("url", url)]
+        params.extend(("category", category) for category in PSI_CATEGORIES)
+        if self.psi_api_key:
+            params.append(("key", self.psi_api_key))
+        return params
+
+    def _run_lighthouse_psi(self, url):
+        """Run Lighthouse through the PageSpeed Insights API"""
+        try:
+            response = self.psi_session.get(
+                PSI_ENDPOINT, params=self._psi_params(url), timeout=PSI_TIMEOUT
+            )
+            if not 200 <= response.status_code < 300:
+                print(f"PageSpeed Insights returned HTTP {response.status_code}")
+                return None
 
-            if chrome_found:
-                print(f"Using Chrome at {chrome_path} for Lighthouse analysis")
-                # Use Chrome with DevTools Protocol
-                lighthouse_command = [
-                    chrome_path,
-                    "--headless",
-                    "--disable-gpu",
-                    "--remote-debugging-port=9222",
-                    "--enable-automation",
-                    "--no-sandbox",
-                    f"--user-data-dir={tempfile.mkdtemp()}",
-                    f"--dump-dom={url}",
-                    "--run-lighthouse",
-                ]
+            return _json_loads(response.content).get("lighthouseResult")
+        except Exception as e:
+            print(f"Error running PageSpeed Insights: {e}")
+            return None
 
-                try:
-                    # Start Chrome with DevTools Protocol
-                    chrome_process = subprocess.Popen(
-                        lighthouse_command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
+    async def _run_lighthouse_psi_async(self, session, semaphore, url):
+        """
+        Run Lighthouse through the PageSpeed Insights API using aiohttp
 
-                    # Wait a moment for Chrome to start
-                    time.sleep(5)
+        Args:
+            session: aiohttp session reserved for PageSpeed Insights calls
+            semaphore: Bounds in-flight calls to the session's per-host limit
+            url: URL of the website to analyze
+        """
+        try:
+            # Wait for a slot before the session timeout starts counting
+            async with semaphore:
+                async with session.get(
+                    PSI_ENDPOINT, params=self._psi_params(url)
+                ) as response:
+                    if not 200 <= response.status < 300:
+                        print(f"PageSpeed Insights returned HTTP {response.status}")
+                        return None
+
+                    data = _json_loads(await response.read())
+                    return data.get("lighthouseResult")
+        except Exception as e:
+            print(f"Error running PageSpeed Insights: {e}")
+            return None
 
-                    # Run Lighthouse via npx
-                    lighthouse_npx_command = [
-                        "npx",
-                        "lighthouse",
-                        url,
-                        "--output=json",
-                        f"--output-path={output_path}",
-                        "--chrome-flags=--headless",
-                        "--only-categories=performance,accessibility,best-practices,seo",
-                    ]
+    def _get_chrome_pool(self):
+        """Return the Chrome pool, launching it on first use"""
+        with self._chrome_pool_lock:
+            if self._chrome_pool is None:
+                self._chrome_pool = ChromePool(
+                    self._chrome_path, size=self.chrome_pool_size
+                )
+            return self._chrome_pool
 
-                    subprocess.run(lighthouse_npx_command, timeout=60, check=False)
+    def _run_lighthouse(self, url):
+        """Run Lighthouse analysis on a website"""
+        # Use a fresh slot in the scratch directory for the output
+        output_path = os.path.join(
+            self._scratch.name, f"lh-{next(self._scratch_counter)}.json"
+        )
 
-                    # Kill the Chrome process
-                    try:
-                        chrome_process.terminate()
-                    except:
-                        pass
+        try:
+            # Use Chrome's DevTools Protocol if Chrome was found at startup
+            chrome_path = self._chrome_path
 
+            if chrome_path:
+                print(f"Using Chrome at {chrome_path} for Lighthouse analysis")
+                try:
+                    # Queue for a Chrome slot first so waiting behind other
+                    # runs doesn't count against the checkout timeout below
+                    with self._chrome_slots:
+                        # Check out a running Chrome and point Lighthouse at it
+                        pool = self._get_chrome_pool()
+                        port = pool.acquire(timeout=60)
+                        try:
+                            lighthouse_npx_command = [
+                                "npx",
+                                "lighthouse",
+                                url,
+                                "--output=json",
+                                f"--output-path={output_path}",
+                                f"--port={port}",
+                                "--only-categories=performance,accessibility,best-practices,seo",
+                            ]
+
+                            subprocess.run(
+                                lighthouse_npx_command, timeout=60, check=False
+                            )
+                        finally:
+                            pool.release(port)
+
+                except queue.Empty:
+                    print("No Chrome instance became available for Lighthouse")
                 except Exception as e:
                     print(f"Error using Chrome DevTools for Lighthouse: {e}")
                     # Fall back to standalone Lighthouse
@@ -278,11 +972,8 @@ class WebsiteAnalyzer:
 
             # Check if the output file exists and has content
             if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                # Read and parse the JSON output
-                with open(output_path, "r") as f:
-                    lighthouse_data = json.load(f)
-
-                return lighthouse_data
+                # Read only the fields we report on from the JSON output
+                return self._extract_lighthouse_fields(output_path)
             else:
                 print("Lighthouse didn't generate output")
                 return None
@@ -294,10 +985,50 @@ class WebsiteAnalyzer:
             print(f"Error running Lighthouse: {e}")
             return None
         finally:
-            # Clean up the temporary file
+            # Remove the report now rather than letting the scratch dir grow
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
+    def _extract_lighthouse_fields(self, path):
+        """
+        Read the category scores and reported audits from a Lighthouse report
+
+        The report is stream-parsed when ijson is installed, so the multi-MB
+        audit details we don't use are never held in memory together.
+
+        Returns:
+            Lighthouse-shaped dictionary with only categories and wanted audits
+        """
+        with open(path, "rb") as f:
+            if ijson is not None:
+                categories = dict(ijson.kvitems(f, "categories", use_float=True))
+                f.seek(0)
+                audits = {
+                    key: audit
+                    for key, audit in ijson.kvitems(f, "audits", use_float=True)
+                    if key in _WANTED_AUDITS
+                }
+            else:
+                lighthouse_data = _json_loads(f.read())
+                categories = lighthouse_data.get("categories", {})
+                audits = lighthouse_data.get("audits", {})
+
+        return {
+            "categories": {
+                name: {"score": category.get("score")}
+                for name, category in categories.items()
+            },
+            "audits": {
+                key: {
+                    field: audit[field]
+                    for field in ("score", "displayValue")
+                    if field in audit
+                }
+                for key, audit in audits.items()
+                if key in _WANTED_AUDITS
+            },
+        }
+
     def _process_lighthouse_results(self, lighthouse_data, results):
         """Process Lighthouse results into our format"""
         try:
@@ -325,76 +1056,18 @@ class WebsiteAnalyzer:
             # Extract important audits and issues
             audits = lighthouse_data.get("audits", {})
 
-            # Performance issues
-            if "largest-contentful-paint" in audits:
-                lcp = audits["largest-contentful-paint"]
-                if lcp.get("score", 1) < 0.5:
-                    results["issues"].append(
-                        f"Slow content loading (LCP: {lcp.get('displayValue')})"
-                    )
+            for key, message in _AUDIT_MESSAGES:
+                audit = audits.get(key)
+                if not audit:
+                    continue
 
-            if "total-blocking-time" in audits:
-                tbt = audits["total-blocking-time"]
-                if tbt.get("score", 1) < 0.5:
+                # Informative and not-applicable audits have a null score
+                score = audit.get("score", 1)
+                if score is not None and score < 0.5:
                     results["issues"].append(
-                        f"Poor interactivity (TBT: {tbt.get('displayValue')})"
+                        message.format(value=audit.get("displayValue"))
                     )
 
-            if "cumulative-layout-shift" in audits:
-                cls = audits["cumulative-layout-shift"]
-                if cls.get("score", 1) < 0.5:
-                    results["issues"].append(
-                        f"Layout shifts during loading (CLS: {cls.get('displayValue')})"
-                    )
-
-            # SEO issues
-            if "meta-description" in audits:
-                if audits["meta-description"].get("score", 1) < 0.5:
-                    results["issues"].append("Missing meta description")
-
-            if "document-title" in audits:
-                if audits["document-title"].get("score", 1) < 0.5:
-                    results["issues"].append("Missing or poor document title")
-
-            # Additional SEO audits
-            if "link-text" in audits:
-                if audits["link-text"].get("score", 1) < 0.5:
-                    results["issues"].append("Poor or generic link text")
-
-            if "hreflang" in audits:
-                if audits["hreflang"].get("score", 1) < 0.5:
-                    results["issues"].append("Incorrect hreflang links")
-
-            if "canonical" in audits:
-                if audits["canonical"].get("score", 1) < 0.5:
-                    results["issues"].append("Missing canonical link")
-
-            if "robots-txt" in audits:
-                if audits["robots-txt"].get("score", 1) < 0.5:
-                    results["issues"].append("Problems with robots.txt")
-
-            if "structured-data" in audits and "score" in audits["structured-data"]:
-                if audits["structured-data"].get("score", 1) < 0.5:
-                    results["issues"].append("Missing structured data")
-
-            # Accessibility issues
-            if "color-contrast" in audits:
-                if audits["color-contrast"].get("score", 1) < 0.5:
-                    results["issues"].append("Poor color contrast for text")
-
-            if "image-alt" in audits:
-                if audits["image-alt"].get("score", 1) < 0.5:
-                    results["issues"].append("Images missing alt text")
-
-            # Best Practices issues
-            if "is-on-https" in audits:
-                if audits["is-on-https"].get("score", 1) < 0.5:
-                    results["issues"].append("Not using HTTPS")
-
-            if "doctype" in audits:
-                if audits["doctype"].get("score", 1) < 0.5:
-                    results["issues"].append("Missing doctype")
-
         except Exception as e:
             results["issues"].append(f"Error processing Lighthouse results: {str(e)}")
 
@@ -402,14 +1075,40 @@ class WebsiteAnalyzer:
         """Perform basic analysis as a fallback when Lighthouse is not available"""
         try:
             # Get the webpage
-            response = requests.get(url, timeout=10)
-            html = response.text.lower()
+            response = self.session.get(url, timeout=10)
+            self._evaluate_page(response.content, response.headers, results)
+        except Exception as e:
+            results["issues"].append(f"Error during basic analysis: {str(e)}")
+
+    async def _perform_basic_analysis_async(self, session, url, results):
+        """Async variant of _perform_basic_analysis using an aiohttp session"""
+        try:
+            # Get the webpage
+            async with session.get(url) as response:
+                body = await response.read()
 
-            # Check response headers
-            headers = response.headers
+            self._evaluate_page(body, response.headers, results)
+        except Exception as e:
+            results["issues"].append(f"Error during basic analysis: {str(e)}")
+
+    def _evaluate_page(self, content, headers, results):
+        """Score a fetched page on basic performance, SEO and accessibility checks"""
+        try:
+            # Parse once and query elements rather than scanning the raw markup;
+            # document_fromstring always yields an <html> root, even for fragments
+            try:
+                tree = lxml_html.document_fromstring(content)
+            except etree.ParserError:
+                # Blank or comment-only pages: check them as an empty document
+                tree = lxml_html.document_fromstring(b"<html></html>")
+            metas = {
+                (meta.get("name") or "").lower(): (meta.get("content") or "").lower()
+                for meta in tree.iter("meta")
+            }
+            images_missing_alt = any(img.get("alt") is None for img in tree.iter("img"))
 
             # Performance checks
-            if len(response.content) > 1000000:  # 1MB
+            if len(content) > 1000000:  # 1MB
                 results["issues"].append("Large page size")
                 results["performance_score"] = 50
             else:
@@ -419,29 +1118,28 @@ class WebsiteAnalyzer:
             results["seo_score"] = 60  # Default
 
             # Check for title
-            if "<title>" not in html or "<title></title>" in html:
+            title = tree.find(".//title")
+            if title is None or not title.text_content().strip():
                 results["issues"].append("Missing page title")
                 results["seo_score"] = max(30, results["seo_score"] - 30)
 
             # Check for meta description
-            if 'meta name="description"' not in html and "meta content=" not in html:
+            if "description" not in metas:
                 results["issues"].append("Missing meta description")
                 results["seo_score"] = max(30, results["seo_score"] - 20)
 
             # Check for heading structure
-            if "<h1" not in html:
+            if tree.find(".//h1") is None:
                 results["issues"].append("Missing H1 heading")
                 results["seo_score"] = max(30, results["seo_score"] - 15)
 
             # Check for image alt text
-            img_tags = html.count("<img")
-            alt_attributes = html.count("alt=")
-            if img_tags > 0 and alt_attributes < img_tags:
+            if images_missing_alt:
                 results["issues"].append("Some images missing alt text")
                 results["seo_score"] = max(30, results["seo_score"] - 10)
 
             # Check for robots meta tag that blocks indexing
-            if 'meta name="robots" content="noindex' in html:
+            if "noindex" in metas.get("robots", ""):
                 results["issues"].append(
                     "Page set to noindex - will not appear in search results"
                 )
@@ -451,14 +1149,14 @@ class WebsiteAnalyzer:
             results["accessibility_score"] = 50  # Default
 
             # Check for alt text on images
-            if "<img " in html and (' alt="' not in html or " alt=" not in html):
+            if images_missing_alt:
                 results["issues"].append("Images may be missing alt text")
                 results["accessibility_score"] = max(
                     30, results["accessibility_score"] - 20
                 )
 
             # Check for form labels
-            if "<form" in html and "<label" not in html:
+            if tree.find(".//form") is not None and tree.find(".//label") is None:
                 results["issues"].append("Forms may be missing labels")
                 results["accessibility_score"] = max(
                     30, results["accessibility_score"] - 15
@@ -485,8 +1183,9 @@ class WebsiteAnalyzer:
 
             # Check for JavaScript libraries with known vulnerabilities
             risky_js_libs = ["jquery-1.", "jquery-2.0", "angular.js@1.", "bootstrap-2"]
+            asset_urls = " ".join(tree.xpath("//script/@src | //link/@href")).lower()
             for risky_lib in risky_js_libs:
-                if risky_lib in html:
+                if risky_lib in asset_urls:
                     results["issues"].append(
                         f"Using potentially outdated library: {risky_lib}"
                     )
@@ -508,7 +1207,9 @@ class WebsiteAnalyzer:
         3 - Low priority (Good website)
         """
         # No website - always highest priority
-        if "Error accessing website" in " ".join(results["issues"]):
+        if any(
+            issue.startswith("Error accessing website") for issue in results["issues"]
+        ):
             return 1
 
         # Initialize scores with weights for different factors
@@ -526,8 +1227,9 @@ class WebsiteAnalyzer:
         weighted_avg = sum(weighted_scores.values())
 
         # Count critical issues
+        issues_text = " ".join(results["issues"]).lower()
         critical_seo_issues = any(
-            issue in " ".join(results["issues"]).lower()
+            issue in issues_text
             for issue in [
                 "missing meta description",
                 "missing page title",
@@ -538,7 +1240,7 @@ class WebsiteAnalyzer:
         )
 
         critical_security_issues = any(
-            issue in " ".join(results["issues"]).lower()
+            issue in issues_text
             for issue in [
                 "not using https",
                 "missing security headers",
@@ -0,0 +1,108 @@
+"""
+Cache module for storing website analysis results between runs
+"""
+
+import os
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+class ResultCache:
+    """TTL key/value cache backed by Redis, falling back to disk or memory"""
+
+    def __init__(self, redis_url=None, cache_dir=None):
+        """
+        Initialize the cache
+
+        Args:
+            redis_url: Redis connection URL (defaults to $LEADGEN_REDIS)
+            cache_dir: Directory for the disk cache when Redis is unavailable
+        """
+        self._redis = None
+        self._disk = None
+        self._memory = {}
+
+        if redis is not None:
+            try:
+                client = redis.Redis.from_url(
+                    redis_url
+                    or os.environ.get("LEADGEN_REDIS", "redis://localhost:6379/0"),
+                    socket_timeout=0.2,
+                )
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                print(f"Redis cache unavailable, falling back: {e}")
+
+        if self._redis is None and diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(
+                    cache_dir
+                    or os.path.join(os.path.expanduser("~"), "UKLeadGen", "cache")
+                )
+            except Exception as e:
+                print(f"Disk cache unavailable, using memory cache: {e}")
+
+    def get(self, key):
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value (str or bytes) or None if missing or expired
+        """
+        try:
+            if self._redis is not None:
+                return self._redis.get(key)
+
+            if self._disk is not None:
+                return self._disk.get(key)
+
+            entry = self._memory.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            self._memory.pop(key, None)
+        except Exception as e:
+            print(f"Error reading from cache: {e}")
+
+        return None
+
+    def set(self, key, value, ttl):
+        """
+        Store a value with an expiry
+
+        Args:
+            key: Cache key
+            value: Serialized value to store
+            ttl: Time to live in seconds
+        """
+        try:
+            if self._redis is not None:
+                self._redis.setex(key, ttl, value)
+            elif self._disk is not None:
+                self._disk.set(key, value, expire=ttl)
+            else:
+                self._memory[key] = (time.monotonic() + ttl, value)
+        except Exception as e:
+            print(f"Error writing to cache: {e}")
+
+    def close(self):
+        """Clean up resources"""
+        try:
+            if self._redis is not None:
+                self._redis.close()
+            if self._disk is not None:
+                self._disk.close()
+        except Exception:
+            pass
@@ -280,6 +280,9 @@ class SearchPanel(QWidget):
         self, location, category, limit, analyze_websites, priority_focus
     ):
         """Perform search operation in the background thread"""
+        database = None
+        scraper = None
+        analyzer = None
         try:
             # Create database for this location
             db_dir = os.path.join(os.path.expanduser("~"), "UKLeadGen", "data")
@@ -295,7 +298,6 @@ class SearchPanel(QWidget):
             scraper = BusinessScraper(use_selenium=True)
 
             # Create analyzer if needed
-            analyzer = None
             if analyze_websites:
                 self.update_status("Initializing website analyzer...", 10)
                 analyzer = WebsiteAnalyzer(use_lighthouse=True)
@@ -390,11 +392,6 @@ class SearchPanel(QWidget):
                 f"Search completed. Found {len(businesses)} businesses.", 100
             )
 
-            # Clean up
-            database.close()
-            if scraper:
-                scraper.close()
-
             # Emit completed signal
             self.search_completed.emit(len(businesses))
 
@@ -406,6 +403,14 @@ class SearchPanel(QWidget):
             self.search_error.emit(str(e))
 
         finally:
+            # Clean up, including any Chrome instances the analyzer started
+            if database:
+                database.close()
+            if scraper:
+                scraper.close()
+            if analyzer:
+                analyzer.close()
+
             # Update UI from main thread
             from PySide6.QtCore import QMetaObject, Qt, Q_ARG
 
@@ -4,6 +4,7 @@ Helper functions for the UK Business Lead Generator
 """
 import re
 import time
+import random
 import datetime
 import logging
 import os
@@ -12,6 +13,106 @@ import json
 import requests
 from urllib.parse import urlparse
 
+# Regular expressions are compiled once at import time
+
+# UK postcode: outward code (group 1) and inward code (group 2); the anchored
+# form validates a whole string, the plain one finds a postcode within text
+_UK_POSTCODE_CORE = r"([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2})"
+_UK_POSTCODE_RE = re.compile(_UK_POSTCODE_CORE)
+_UK_POSTCODE_RE_ANCHORED = re.compile("^" + _UK_POSTCODE_CORE + "$")
+
+_LOC_CHARS = re.compile(r"^[a-zA-Z\s\-\']+$")
+_EMAIL = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+
+# URLs of this shape (no port, query, fragment or params) are already clean
+_CLEAN_URL_FAST = re.compile(r"https?://[A-Za-z0-9.\-]+(?:/[A-Za-z0-9._~\-/%]*)?")
+
+# Specific UK phone number patterns, combined into one alternation so the text
+# is scanned once; earlier alternatives win when several match at one position
+_PHONE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"(?:(?:\+44\s?[0-9]{4}|\(?0[0-9]{4}\)?)\s?[0-9]{3}\s?[0-9]{3})",  # +44 7700 900000
+            r"(?:(?:\+44\s?[0-9]{3}|\(?0[0-9]{3}\)?)\s?[0-9]{3}\s?[0-9]{4})",  # +44 121 234 5678
+            r"(?:(?:\+44\s?[0-9]{2}|\(?0[0-9]{2}\)?)\s?[0-9]{4}\s?[0-9]{4})",  # +44 20 1234 5678
+            r"(?:\+44\s?7[0-9]{3}|(?:^|\s)07[0-9]{3})\s?[0-9]{6}",  # +44 7123 456789
+            r"(?:\+44\s?7[0-9]{9})",  # +44 7123456789
+        )
+    )
+)
+
+# Loose catch-all, only tried when none of the specific patterns match
+_PHONE_FALLBACK = re.compile(r"\b[0-9]{5}\s?[0-9]{5,6}\b")  # 01234 567890
+
+# Major UK cities, towns, counties and regions (lowercase)
+_MAJOR_UK_LOCATIONS = frozenset({
+    # Major cities
+    "london",
+    "manchester",
+    "birmingham",
+    "liverpool",
+    "leeds",
+    "glasgow",
+    "edinburgh",
+    "cardiff",
+    "belfast",
+    "bristol",
+    "newcastle",
+    "sheffield",
+    "nottingham",
+    "leicester",
+    "coventry",
+    "bradford",
+    "brighton",
+    "southampton",
+    "plymouth",
+    "reading",
+    "derby",
+    "wolverhampton",
+    "hull",
+    "portsmouth",
+    "oxford",
+    "cambridge",
+    "york",
+    "swansea",
+    "dundee",
+    "aberdeen",
+    # Counties and regions
+    "kent",
+    "surrey",
+    "essex",
+    "suffolk",
+    "norfolk",
+    "devon",
+    "cornwall",
+    "dorset",
+    "hampshire",
+    "berkshire",
+    "wiltshire",
+    "somerset",
+    "gloucestershire",
+    "oxfordshire",
+    "buckinghamshire",
+    "hertfordshire",
+    "bedfordshire",
+    "cambridgeshire",
+    "northamptonshire",
+    "lincolnshire",
+    "warwickshire",
+    "leicestershire",
+    "nottinghamshire",
+    "yorkshire",
+    "lancashire",
+    "cumbria",
+    "northumberland",
+})
+
+# Filler words dropped from business types
+_COMMON_WORDS = frozenset(
+    {"in", "and", "the", "a", "an", "of", "for", "to", "with", "by"}
+)
+
 
 def validate_uk_location(location):
     """
@@ -31,74 +132,9 @@ def validate_uk_location(location):
     location = location.strip()
 
     # If it's a UK postcode format
-    # Improved UK postcode regex that handles various formats
-    uk_postcode_pattern = r"^(([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2}))$|^(([A-Z]{1,2}[0-9][0-9])\s*([0-9][A-Z]{2}))$"
-    if re.match(uk_postcode_pattern, location.upper()):
+    if _UK_POSTCODE_RE_ANCHORED.match(location.upper()):
         return True
 
-    # If it's a major UK city or town (expanded list)
-    major_uk_locations = [
-        # Major cities
-        "london",
-        "manchester",
-        "birmingham",
-        "liverpool",
-        "leeds",
-        "glasgow",
-        "edinburgh",
-        "cardiff",
-        "belfast",
-        "bristol",
-        "newcastle",
-        "sheffield",
-        "nottingham",
-        "leicester",
-        "coventry",
-        "bradford",
-        "brighton",
-        "southampton",
-        "plymouth",
-        "reading",
-        "derby",
-        "wolverhampton",
-        "hull",
-        "portsmouth",
-        "oxford",
-        "cambridge",
-        "york",
-        "swansea",
-        "dundee",
-        "aberdeen",
-        # Counties and regions
-        "kent",
-        "surrey",
-        "essex",
-        "suffolk",
-        "norfolk",
-        "devon",
-        "cornwall",
-        "dorset",
-        "hampshire",
-        "berkshire",
-        "wiltshire",
-        "somerset",
-        "gloucestershire",
-        "oxfordshire",
-        "buckinghamshire",
-        "hertfordshire",
-        "bedfordshire",
-        "cambridgeshire",
-        "northamptonshire",
-        "lincolnshire",
-        "warwickshire",
-        "leicestershire",
-        "nottinghamshire",
-        "yorkshire",
-        "lancashire",
-        "cumbria",
-        "northumberland",
-    ]
-
     # Common town suffixes
     uk_town_suffixes = [
         "ham",
@@ -129,7 +165,7 @@ def validate_uk_location(location):
     location_lower = location.lower()
 
     # Check if it's a major city or town
-    if location_lower in major_uk_locations:
+    if location_lower in _MAJOR_UK_LOCATIONS:
         return True
 
     # Check for common UK place name patterns
@@ -158,7 +194,7 @@ def validate_uk_location(location):
                 return True
 
     # If it's at least a reasonable length and contains only valid characters for a UK place name
-    if len(location) >= 3 and re.match(r"^[a-zA-Z\s\-\']+$", location):
+    if len(location) >= 3 and _LOC_CHARS.match(location):
         # Additional check for reasonable word length and structure
         words = location.split()
         if all(len(word) >= 2 for word in words) and len(words) <= 4:
@@ -184,6 +220,10 @@ def clean_url(url):
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
+    # Skip the full parse for URLs that parsing wouldn't change
+    if not url.endswith("/") and _CLEAN_URL_FAST.fullmatch(url):
+        return url
+
     # Remove trailing slashes, common tracking parameters, etc.
     try:
         parsed = urlparse(url)
@@ -225,39 +265,28 @@ def extract_phone_number(text):
     if not text:
         return None
 
-    # UK phone number patterns
-    patterns = [
-        r"(?:(?:\+44\s?[0-9]{4}|\(?0[0-9]{4}\)?)\s?[0-9]{3}\s?[0-9]{3})",  # +44 7700 900000
-        r"(?:(?:\+44\s?[0-9]{3}|\(?0[0-9]{3}\)?)\s?[0-9]{3}\s?[0-9]{4})",  # +44 121 234 5678
-        r"(?:(?:\+44\s?[0-9]{2}|\(?0[0-9]{2}\)?)\s?[0-9]{4}\s?[0-9]{4})",  # +44 20 1234 5678
-        r"(?:\+44\s?7[0-9]{3}|(?:^|\s)07[0-9]{3})\s?[0-9]{6}",  # +44 7123 456789
-        r"(?:\+44\s?7[0-9]{9})",  # +44 7123456789
-        r"\b[0-9]{5}\s?[0-9]{5,6}\b",  # 01234 567890
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            # Format the phone number consistently
-            phone = match.group(0)
+    match = _PHONE.search(text) or _PHONE_FALLBACK.search(text)
+    if not match:
+        return None
 
-            # Remove non-digit characters for standardization
-            digits = "".join(c for c in phone if c.isdigit())
+    # Format the phone number consistently
+    phone = match.group(0)
 
-            # Handle +44 vs 0 prefix
-            if phone.startswith("+44"):
-                # Convert +44 to 0
-                digits = "0" + digits[3:]
+    # Remove non-digit characters for standardization
+    digits = "".join(c for c in phone if c.isdigit())
 
-            # Format based on number type
-            if len(digits) == 11 and digits.startswith("07"):  # Mobile
-                return f"{digits[:5]} {digits[5:8]} {digits[8:]}"
-            elif len(digits) == 11:  # Landline
-                return f"{digits[:5]} {digits[5:]}"
-            else:
-                return phone  # Return as is if we can't standardize
+    # Handle +44 vs 0 prefix
+    if phone.startswith("+44"):
+        # Convert +44 to 0
+        digits = "0" + digits[3:]
 
-    return None
+    # Format based on number type
+    if len(digits) == 11 and digits.startswith("07"):  # Mobile
+        return f"{digits[:5]} {digits[5:8]} {digits[8:]}"
+    elif len(digits) == 11:  # Landline
+        return f"{digits[:5]} {digits[5:]}"
+    else:
+        return phone  # Return as is if we can't standardize
 
 
 def extract_email(text):
@@ -273,9 +302,7 @@ def extract_email(text):
     if not text:
         return None
 
-    # Improved email regex that handles more valid formats
-    pattern = r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
-    match = re.search(pattern, text)
+    match = _EMAIL.search(text)
 
     if match:
         email = match.group(0)
@@ -316,23 +343,13 @@ def extract_postcode(text):
     if not text:
         return None
 
-    # UK postcode pattern with improved regex
-    uk_postcode = r"[A-Z]{1,2}[0-9][A-Z0-9]?\s*[0-9][A-Z]{2}"
-    match = re.search(uk_postcode, text.upper())
+    match = _UK_POSTCODE_RE.search(text.upper())
 
     if match:
-        postcode = match.group(0)
-
-        # Format postcode with proper spacing
-        # Find the last number in the outward code
-        parts = re.match(r"([A-Z]{1,2}[0-9][A-Z0-9]?)\s*([0-9][A-Z]{2})", postcode)
-
-        if parts:
-            outward = parts.group(1)
-            inward = parts.group(2)
-            postcode = f"{outward} {inward}"
-
-        return postcode
+        # Format postcode with proper spacing between outward and inward codes
+        outward = match.group(1)
+        inward = match.group(2)
+        return f"{outward} {inward}"
 
     return None
 
@@ -351,10 +368,8 @@ def format_business_type(business_type):
         return "Business"
 
     # Remove common words like "in", "and", etc.
-    common_words = ["in", "and", "the", "a", "an", "of", "for", "to", "with", "by"]
-
     words = business_type.split()
-    filtered_words = [w for w in words if w.lower() not in common_words]
+    filtered_words = [w for w in words if w.lower() not in _COMMON_WORDS]
 
     if not filtered_words:
         return "Business"
@@ -393,8 +408,6 @@ def rate_limit_sleep(min_seconds=0.5, max_seconds=2.0):
         min_seconds: Minimum sleep time
         max_seconds: Maximum sleep time
     """
-    import random
-
     sleep_time = random.uniform(min_seconds, max_seconds)
     time.sleep(sleep_time)
 